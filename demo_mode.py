@@ -4,17 +4,19 @@ Demo Mode - Simula execução do jogo sem PyBoy
 Útil quando PyBoy não pode ser instalado (Python 3.13+)
 """
 
+import os
 import sys
 import time
 import random
-from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
 # Add project root to Python path
-project_root = Path(__file__).parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from src.event_bus import EventBus
+from src.event_bus import EventBus, PlayerMovedEvent
 from src.event_processors import (
     BattleCounterProcessor,
     StepCounterProcessor,
@@ -32,14 +34,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_DIRECTIONS = ("up", "down", "left", "right")
+_ITEMS = ("Potion", "Pokeball", "Antidote", "Poké Flute")
+
+# Payloads fixos, montados uma única vez; os subscribers recebem um
+# mappingproxy (somente leitura) em event.data
+_BATTLE_STARTED = MappingProxyType({"frame": 1000})
+_BATTLE_ENDED = {
+    result: MappingProxyType({"frame": 1500, "result": result})
+    for result in ("won", "lost")
+}
+_POST_BATTLE_HEAL = MappingProxyType({
+    "healing": 20,
+    "current_health": 100,
+    "previous_health": 80
+})
+
 
 class GameSimulator:
     """Simula gameplay de um jogo Game Boy"""
 
-    def __init__(self, event_bus: EventBus, rom_name: str):
+    def __init__(self, event_bus: EventBus, rom_name: str, seed: Optional[int] = None):
         self.event_bus = event_bus
         self.rom_name = rom_name
         self.running = True
+        # Gerador próprio: reprodutível via seed e sem lookups no módulo random
+        self._rng = random.Random(seed)
 
     def simulate_gameplay(self, duration_seconds: int = 30):
         """Simula uma sessão de jogo"""
@@ -53,20 +73,22 @@ class GameSimulator:
         self.event_bus.publish("game_started", {"rom": self.rom_name})
         time.sleep(1)
 
-        start_time = time.time()
+        monotonic = time.monotonic
+        sleep = time.sleep
+        start_time = monotonic()
+        deadline = start_time + duration_seconds
         step_count = 0
+        rand = self._rng.random
 
         try:
-            while self.running and (time.time() - start_time) < duration_seconds:
+            while self.running and monotonic() < deadline:
                 # Simular movimento aleatório
-                if random.random() < 0.7:  # 70% chance de movimento
-                    direction = random.choice(["up", "down", "left", "right"])
+                if rand() < 0.7:  # 70% chance de movimento
+                    direction = _DIRECTIONS[int(rand() * 4)]
                     step_count += 1
-                    self.event_bus.publish("player_moved", {
-                        "direction": direction,
-                        "position": (step_count, step_count, 1),
-                        "step_number": step_count
-                    })
+                    self.event_bus.publish(PlayerMovedEvent(
+                        direction, (step_count, step_count, 1), step_count
+                    ))
 
                     if step_count % 10 == 0:
                         print(f"  🚶 {step_count} passos dados...")
@@ -76,42 +98,39 @@ class GameSimulator:
                     self._simulate_battle()
 
                 # Simular interações
-                if random.random() < 0.1:  # 10% chance
+                if rand() < 0.1:  # 10% chance
                     self._simulate_interaction()
 
-                time.sleep(0.1)  # Pausa entre ações
+                sleep(0.1)  # Pausa entre ações
 
         except KeyboardInterrupt:
             print("\n\n⏸️  Gameplay interrompido pelo usuário")
 
         # End game
         self.event_bus.publish("game_ended", {
-            "total_frames": int((time.time() - start_time) * 60),
+            "total_frames": int((monotonic() - start_time) * 60),
             "total_steps": step_count
         })
 
     def _simulate_battle(self):
         """Simula uma batalha"""
         print("\n  ⚔️  Batalha iniciada!")
-        self.event_bus.publish("battle_started", {"frame": 1000})
-        time.sleep(0.5)
-
-        # Simular alguns ataques
-        for _ in range(random.randint(2, 4)):
-            damage = random.randint(10, 30)
-            self.event_bus.publish("player_damaged", {
-                "damage": damage,
-                "current_health": 100 - damage,
-                "previous_health": 100
-            })
-            time.sleep(0.3)
+        self.event_bus.publish("battle_started", _BATTLE_STARTED)
+
+        # Simular alguns ataques, publicados juntos em um único evento; a
+        # duração total da batalha (0.5s de abertura + 0.3s por ataque) é
+        # aguardada de uma só vez no final
+        rng = self._rng
+        attacks = rng.randint(2, 4)
+        battle_end = time.monotonic() + 0.5 + 0.3 * attacks
+        self.event_bus.publish("battle_damage_sequence", {
+            "damages": [rng.randint(10, 30) for _ in range(attacks)]
+        })
+        time.sleep(max(0.0, battle_end - time.monotonic()))
 
         # Resultado aleatório
-        result = random.choice(["won", "won", "lost"])  # 66% chance de vitória
-        self.event_bus.publish("battle_ended", {
-            "frame": 1500,
-            "result": result
-        })
+        result = rng.choice(("won", "won", "lost"))  # 66% chance de vitória
+        self.event_bus.publish("battle_ended", _BATTLE_ENDED[result])
 
         emoji = "🎉" if result == "won" else "💀"
         print(f"  {emoji} Batalha {result}!")
@@ -119,22 +138,18 @@ class GameSimulator:
         # Cura após batalha
         if result == "won":
             time.sleep(0.2)
-            self.event_bus.publish("player_healed", {
-                "healing": 20,
-                "current_health": 100,
-                "previous_health": 80
-            })
+            self.event_bus.publish("player_healed", _POST_BATTLE_HEAL)
 
     def _simulate_interaction(self):
         """Simula interação com NPC ou item"""
-        interaction_type = random.choice(["npc", "item", "door"])
+        rng = self._rng
+        interaction_type = rng.choice(("npc", "item", "door"))
 
         if interaction_type == "npc":
-            self.event_bus.publish("npc_interaction", {"npc_id": random.randint(1, 10)})
+            self.event_bus.publish("npc_interaction", {"npc_id": rng.randint(1, 10)})
             print("  💬 Conversa com NPC")
         elif interaction_type == "item":
-            items = ["Potion", "Pokeball", "Antidote", "Poké Flute"]
-            item = random.choice(items)
+            item = rng.choice(_ITEMS)
             self.event_bus.publish("item_collected", {"item": item})
             print(f"  📦 Item coletado: {item}")
         else:
@@ -162,6 +177,12 @@ def main():
         default=30,
         help="Duração da simulação em segundos (padrão: 30)"
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semente do gerador aleatório para simulações reprodutíveis"
+    )
 
     args = parser.parse_args()
 
@@ -180,8 +201,11 @@ def main():
     # Initialize Report Generator
     report_generator = ReportGenerator(event_bus, processors)
 
+    # All subscriptions are in place: enable direct dispatch
+    event_bus.compile_dispatch()
+
     # Create and run simulator
-    simulator = GameSimulator(event_bus, args.rom)
+    simulator = GameSimulator(event_bus, args.rom, seed=args.seed)
     simulator.simulate_gameplay(args.duration)
 
 
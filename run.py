@@ -4,12 +4,12 @@ Launcher script for Event-Driven PyBoy.
 Executes the main application from the project root.
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
 
 # Import and run main
 from src.main import main
@@ -4,15 +4,20 @@ Test runner for Event-Driven PyBoy.
 Executes all tests from the project root.
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
 
 # Import and run tests
-from tests.test_event_system import simulate_gameplay, test_event_bus_basic
+from tests.test_event_system import (
+    run_wrapper_tests,
+    simulate_gameplay,
+    test_event_bus_basic,
+    test_health_monitor_damage_sequence
+)
 
 if __name__ == "__main__":
     print("\n" + "="*60)
@@ -21,6 +26,8 @@ if __name__ == "__main__":
 
     # Run basic tests
     test_event_bus_basic()
+    test_health_monitor_damage_sequence()
+    run_wrapper_tests()
 
     # Run full simulation
     simulate_gameplay()
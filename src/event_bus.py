@@ -3,25 +3,145 @@ Event Bus Implementation - Publish/Subscribe Pattern
 Handles event distribution across all event processors in the system.
 """
 
-from typing import Callable, Dict, List, Any
-from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Any, Mapping, Optional, Tuple, Union
+from collections import deque
 from datetime import datetime
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_now = datetime.now
+
+# Default number of events kept in EventBus history
+EVENT_HISTORY_MAX = 10_000
+
+
+def _NOOP(*args, **kwargs) -> None:
+    """Stand-in for log methods whose level is disabled."""
+
+
+def bind_log_methods(log: logging.Logger) -> Tuple[Callable, Callable]:
+    """
+    Resolve a logger's debug/info methods once.
+
+    Disabled levels are replaced by a no-op so hot paths skip the logging
+    machinery entirely. Call again after changing log levels.
+
+    Args:
+        log: The logger to bind
+
+    Returns:
+        Tuple of (debug, info) callables
+    """
+    debug = log.debug if log.isEnabledFor(logging.DEBUG) else _NOOP
+    info = log.info if log.isEnabledFor(logging.INFO) else _NOOP
+    return debug, info
+
 
-@dataclass
 class Event:
     """Represents an event in the system."""
-    event_type: str
-    data: Dict[str, Any]
-    timestamp: datetime = None
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    __slots__ = ("event_type", "data", "timestamp", "_hash")
+
+    def __init__(self, event_type: str, data: Mapping[str, Any], timestamp: datetime = None):
+        self.event_type = event_type
+        self.data = data
+        self.timestamp = timestamp if timestamp is not None else _now()
+        self._hash = None
+
+    # Events are compared by identity; the hash is computed on first use only.
+    __eq__ = object.__eq__
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self.event_type, id(self.data)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Event(event_type={self.event_type!r}, data={self.data!r}, timestamp={self.timestamp!r})"
+
+
+class TypedEvent(Event):
+    """
+    Event whose payload lives in slots instead of a data dict.
+
+    Subclasses declare EVENT_TYPE and one slot per payload field, so
+    subscribers read e.g. ``event.damage`` directly. ``data`` is still
+    available for generic consumers and is built on first access.
+    """
+
+    __slots__ = ("_source",)
+    EVENT_TYPE = ""
+
+    def _init_event(self, timestamp: Optional[datetime]) -> None:
+        self.event_type = self.EVENT_TYPE
+        self.timestamp = timestamp if timestamp is not None else _now()
+        self._hash = None
+        self._source = None
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        if self._source is None:
+            self._source = {name: getattr(self, name) for name in self.__slots__}
+        return self._source
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any], timestamp: datetime = None) -> "TypedEvent":
+        """Build a typed event from a payload dict, keeping the dict as ``data``."""
+        event = cls(**{name: data[name] for name in cls.__slots__ if name in data},
+                    timestamp=timestamp)
+        event._source = data
+        return event
+
+
+class PlayerMovedEvent(TypedEvent):
+    """Typed ``player_moved`` event."""
+
+    __slots__ = ("direction", "position", "step_number")
+    EVENT_TYPE = "player_moved"
+
+    def __init__(self, direction: str = "unknown", position: tuple = None,
+                 step_number: int = 0, timestamp: datetime = None):
+        self._init_event(timestamp)
+        self.direction = direction
+        self.position = position
+        self.step_number = step_number
+
+
+class PlayerDamagedEvent(TypedEvent):
+    """Typed ``player_damaged`` event."""
+
+    __slots__ = ("damage", "current_health", "previous_health")
+    EVENT_TYPE = "player_damaged"
+
+    def __init__(self, damage: int = 0, current_health: int = None,
+                 previous_health: int = None, timestamp: datetime = None):
+        self._init_event(timestamp)
+        self.damage = damage
+        self.current_health = current_health
+        self.previous_health = previous_health
+
+
+class PlayerHealedEvent(TypedEvent):
+    """Typed ``player_healed`` event."""
+
+    __slots__ = ("healing", "current_health", "previous_health")
+    EVENT_TYPE = "player_healed"
+
+    def __init__(self, healing: int = 0, current_health: int = None,
+                 previous_health: int = None, timestamp: datetime = None):
+        self._init_event(timestamp)
+        self.healing = healing
+        self.current_health = current_health
+        self.previous_health = previous_health
+
+
+# Event types published as dicts are converted to these classes, so their
+# subscribers can always rely on typed attributes.
+TYPED_EVENTS: Dict[str, type] = {
+    cls.EVENT_TYPE: cls
+    for cls in (PlayerMovedEvent, PlayerDamagedEvent, PlayerHealedEvent)
+}
 
 
 class EventBus:
@@ -31,64 +151,172 @@ class EventBus:
     and automatically receive notifications when those events are published.
     """
 
-    def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_history: List[Event] = []
+    def __init__(self, history_limit: Optional[int] = EVENT_HISTORY_MAX):
+        """
+        Initialize the Event Bus.
+
+        Args:
+            history_limit: Maximum number of events kept in history
+                          (oldest are discarded). None keeps every event.
+                          Recording is off until enable_history() is called.
+        """
+        # Subscriptions per event type, keyed by the handle subscribe() returns
+        self._subscribers: Dict[str, Dict[int, Callable]] = {}
+        self._next_handle = 0
+        # Event types are interned to small ints on first subscribe; publish()
+        # reads immutable snapshots of _subscribers indexed by that id,
+        # rebuilt on every (rare) subscribe/unsubscribe.
+        self._event_ids: Dict[str, int] = {}
+        self._callbacks_by_id: List[Tuple[Callable, ...]] = []
+        # Event types with exactly one subscriber, called directly by
+        # publish() once compile_dispatch() has run.
+        self._fastpath: Dict[str, Callable[[Event], None]] = {}
+        self._dispatch_compiled = False
+        self._event_history: Deque[Event] = deque(maxlen=history_limit)
+        # History is opt-in: nothing on the runtime path reads it
+        self._record_history = False
+        self.reconfigure_logging()
         logger.info("Event Bus initialized")
 
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def reconfigure_logging(self) -> None:
+        """Re-bind cached log methods after the log level changes."""
+        self._debug, self._info = bind_log_methods(logger)
+
+    def subscribe(self, event_type: str, callback: Callable[[Event], None]) -> int:
         """
         Subscribe a callback function to a specific event type.
 
         Args:
             event_type: The type of event to subscribe to
             callback: Function to call when event is published
-        """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
 
-        self._subscribers[event_type].append(callback)
-        logger.info(f"Subscriber registered for event type: {event_type}")
+        Returns:
+            Subscription handle, accepted by unsubscribe()
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._subscribers.setdefault(event_type, {})[handle] = callback
+        self._rebuild_snapshot(event_type)
+        self._info("Subscriber registered for event type: %s", event_type)
+        return handle
 
-    def unsubscribe(self, event_type: str, callback: Callable[[Event], None]) -> None:
+    def unsubscribe(self, event_type: str,
+                    subscription: Union[int, Callable[[Event], None]]) -> None:
         """
-        Unsubscribe a callback from an event type.
+        Unsubscribe from an event type.
 
         Args:
             event_type: The event type to unsubscribe from
-            callback: The callback function to remove
+            subscription: Handle returned by subscribe() (constant time), or
+                          the callback itself (linear search)
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(callback)
-                logger.info(f"Subscriber removed from event type: {event_type}")
-            except ValueError:
-                logger.warning(f"Callback not found for event type: {event_type}")
+        subscribers = self._subscribers.get(event_type)
+        if subscribers is None:
+            return
+
+        handle = subscription
+        if not isinstance(subscription, int):
+            handle = next((h for h, cb in subscribers.items() if cb == subscription), None)
 
-    def publish(self, event_type: str, data: Dict[str, Any] = None) -> None:
+        if subscribers.pop(handle, None) is None:
+            logger.warning("Callback not found for event type: %s", event_type)
+            return
+
+        self._rebuild_snapshot(event_type)
+        self._info("Subscriber removed from event type: %s", event_type)
+
+    def publish(self, event_type: Union[str, Event], data: Mapping[str, Any] = None) -> None:
         """
         Publish an event to all subscribed callbacks.
 
         Args:
-            event_type: The type of event to publish
-            data: Optional data associated with the event
+            event_type: The type of event to publish, or a ready-made Event
+                        (e.g. a TypedEvent), in which case data is ignored.
+                        A plain Event for a typed event type is converted
+                        to its TypedEvent class.
+            data: Optional data associated with the event; any mapping,
+                  including read-only ones such as MappingProxyType
         """
-        event = Event(event_type=event_type, data=data or {})
-        self._event_history.append(event)
+        if isinstance(event_type, Event):
+            event = event_type
+            event_type = event.event_type
+            typed = TYPED_EVENTS.get(event_type)
+            if typed is not None and not isinstance(event, typed):
+                event = typed.from_data(event.data, event.timestamp)
+        else:
+            typed = TYPED_EVENTS.get(event_type)
+            if typed is not None:
+                event = typed.from_data(data or {})
+            else:
+                event = Event(event_type=event_type, data=data or {})
+        if self._record_history:
+            self._event_history.append(event)
+
+        fast = self._fastpath.get(event_type)
+        if fast is not None:
+            self._debug("Publishing event: %s to 1 subscriber", event_type)
+            try:
+                fast(event)
+            except Exception as e:
+                logger.error("Error in subscriber callback for %s: %s", event_type, e)
+            return
+
+        eid = self._event_ids.get(event_type)
+        if eid is None or not self._callbacks_by_id[eid]:
+            self._debug("No subscribers for event type: %s", event_type)
+            return
 
-        if event_type in self._subscribers:
-            logger.debug(f"Publishing event: {event_type} to {len(self._subscribers[event_type])} subscribers")
-            for callback in self._subscribers[event_type]:
-                try:
+        callbacks = self._callbacks_by_id[eid]
+        self._debug("Publishing event: %s to %d subscribers", event_type, len(callbacks))
+        # A single try block covers the whole loop; on failure the shared
+        # iterator resumes with the next callback.
+        remaining = iter(callbacks)
+        while True:
+            try:
+                for callback in remaining:
                     callback(event)
-                except Exception as e:
-                    logger.error(f"Error in subscriber callback for {event_type}: {e}")
-        else:
-            logger.debug(f"No subscribers for event type: {event_type}")
+                return
+            except Exception as e:
+                logger.error("Error in subscriber callback for %s: %s", event_type, e)
+
+    def _rebuild_snapshot(self, event_type: str) -> None:
+        """Refresh the dispatch tuple for an event type, interning it if new."""
+        eid = self._event_ids.get(event_type)
+        if eid is None:
+            eid = self._event_ids[event_type] = len(self._callbacks_by_id)
+            self._callbacks_by_id.append(())
+        subscribers = self._subscribers.get(event_type)
+        callbacks = self._callbacks_by_id[eid] = tuple(subscribers.values()) if subscribers else ()
+
+        if self._dispatch_compiled:
+            if len(callbacks) == 1:
+                self._fastpath[event_type] = callbacks[0]
+            else:
+                self._fastpath.pop(event_type, None)
+
+    def compile_dispatch(self) -> None:
+        """
+        Enable direct dispatch for single-subscriber event types.
+
+        Call once after wiring all processors. Later subscribe/unsubscribe
+        calls keep the direct-dispatch table up to date.
+        """
+        self._dispatch_compiled = True
+        for event_type in self._event_ids:
+            self._rebuild_snapshot(event_type)
+        self._info("Direct dispatch enabled for %d event types", len(self._fastpath))
+
+    def enable_history(self) -> None:
+        """Start recording published events in the history."""
+        self._record_history = True
+
+    def disable_history(self) -> None:
+        """Stop recording published events. Recorded events are kept."""
+        self._record_history = False
 
     def get_event_history(self) -> List[Event]:
-        """Returns the history of all published events."""
-        return self._event_history.copy()
+        """Returns the history of published events, oldest first."""
+        return list(self._event_history)
 
     def clear_history(self) -> None:
         """Clears the event history."""
@@ -107,5 +335,5 @@ class EventBus:
             Number of subscribers
         """
         if event_type:
-            return len(self._subscribers.get(event_type, []))
+            return len(self._subscribers.get(event_type, {}))
         return sum(len(callbacks) for callbacks in self._subscribers.values())
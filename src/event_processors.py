@@ -3,27 +3,45 @@ Event Processors - Handle specific events and maintain statistics.
 Each processor is responsible for a specific aspect of game tracking.
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from src.event_bus import Event, EventBus
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.event_bus import (
+    Event,
+    EventBus,
+    PlayerDamagedEvent,
+    PlayerHealedEvent,
+    PlayerMovedEvent,
+    bind_log_methods
+)
 from typing import Dict, Any
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+_now = datetime.now
+
+
+class LogMethodsMixin:
+    """Caches this module's logger debug/info methods on the processor."""
+
+    def reconfigure_logging(self) -> None:
+        """Re-bind cached log methods after the log level changes."""
+        self._debug, self._info = bind_log_methods(logger)
+
 
-class BattleCounterProcessor:
+class BattleCounterProcessor(LogMethodsMixin):
     """Tracks the number of battles that occur during gameplay."""
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.battle_count = 0
         self.battles_won = 0
         self.battles_lost = 0
@@ -38,7 +56,7 @@ class BattleCounterProcessor:
         """Handle battle start event."""
         self.battle_count += 1
         self.last_battle_time = event.timestamp
-        logger.info(f"Battle #{self.battle_count} started at {event.timestamp}")
+        self._info("Battle #%d started at %s", self.battle_count, event.timestamp)
 
     def on_battle_ended(self, event: Event) -> None:
         """Handle battle end event."""
@@ -47,7 +65,7 @@ class BattleCounterProcessor:
             self.battles_won += 1
         elif result == "lost":
             self.battles_lost += 1
-        logger.info(f"Battle ended: {result}")
+        self._info("Battle ended: %s", result)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Return battle statistics."""
@@ -60,11 +78,12 @@ class BattleCounterProcessor:
         }
 
 
-class StepCounterProcessor:
+class StepCounterProcessor(LogMethodsMixin):
     """Tracks the number of steps the player takes in the game."""
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.step_count = 0
         self.steps_by_direction = {"up": 0, "down": 0, "left": 0, "right": 0}
 
@@ -72,16 +91,16 @@ class StepCounterProcessor:
         self.event_bus.subscribe("player_moved", self.on_player_moved)
         logger.info("StepCounterProcessor initialized")
 
-    def on_player_moved(self, event: Event) -> None:
+    def on_player_moved(self, event: PlayerMovedEvent) -> None:
         """Handle player movement event."""
         self.step_count += 1
-        direction = event.data.get("direction", "unknown")
+        direction = event.direction
 
         if direction in self.steps_by_direction:
             self.steps_by_direction[direction] += 1
 
         if self.step_count % 100 == 0:
-            logger.info(f"Player has taken {self.step_count} steps")
+            self._info("Player has taken %d steps", self.step_count)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Return step statistics."""
@@ -91,11 +110,12 @@ class StepCounterProcessor:
         }
 
 
-class GameTimeTracker:
+class GameTimeTracker(LogMethodsMixin):
     """Tracks gameplay time and session information."""
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.start_time = None
         self.end_time = None
         self.pause_count = 0
@@ -112,18 +132,18 @@ class GameTimeTracker:
     def on_game_started(self, event: Event) -> None:
         """Handle game start event."""
         self.start_time = event.timestamp
-        logger.info(f"Game started at {self.start_time}")
+        self._info("Game started at %s", self.start_time)
 
     def on_game_ended(self, event: Event) -> None:
         """Handle game end event."""
         self.end_time = event.timestamp
-        logger.info(f"Game ended at {self.end_time}")
+        self._info("Game ended at %s", self.end_time)
 
     def on_game_paused(self, event: Event) -> None:
         """Handle game pause event."""
         self.pause_count += 1
         self.current_pause_start = event.timestamp
-        logger.info("Game paused")
+        self._info("Game paused")
 
     def on_game_resumed(self, event: Event) -> None:
         """Handle game resume event."""
@@ -131,14 +151,14 @@ class GameTimeTracker:
             pause_duration = (event.timestamp - self.current_pause_start).total_seconds()
             self.total_pause_duration += pause_duration
             self.current_pause_start = None
-            logger.info(f"Game resumed after {pause_duration:.2f}s pause")
+            self._info("Game resumed after %.2fs pause", pause_duration)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Return time statistics."""
         if not self.start_time:
             return {"status": "not_started"}
 
-        end = self.end_time or datetime.now()
+        end = self.end_time or _now()
         total_duration = (end - self.start_time).total_seconds()
         active_duration = total_duration - self.total_pause_duration
 
@@ -152,11 +172,12 @@ class GameTimeTracker:
         }
 
 
-class HealthMonitor:
+class HealthMonitor(LogMethodsMixin):
     """Monitors player health and damage events."""
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.damage_taken = 0
         self.healing_received = 0
         self.knockouts = 0
@@ -165,29 +186,40 @@ class HealthMonitor:
 
         # Subscribe to health events
         self.event_bus.subscribe("player_damaged", self.on_player_damaged)
+        self.event_bus.subscribe("battle_damage_sequence", self.on_battle_damage_sequence)
         self.event_bus.subscribe("player_healed", self.on_player_healed)
         self.event_bus.subscribe("player_fainted", self.on_player_fainted)
         logger.info("HealthMonitor initialized")
 
-    def on_player_damaged(self, event: Event) -> None:
-        """Handle damage event."""
-        damage = event.data.get("damage", 0)
+    def _apply_damage(self, damage: int) -> None:
+        """Record damage taken and lower the current health."""
         self.damage_taken += damage
         self.current_health = max(0, self.current_health - damage)
-        logger.debug(f"Player took {damage} damage. Current health: {self.current_health}")
 
-    def on_player_healed(self, event: Event) -> None:
+    def on_player_damaged(self, event: PlayerDamagedEvent) -> None:
+        """Handle damage event."""
+        damage = event.damage
+        self._apply_damage(damage)
+        self._debug("Player took %s damage. Current health: %s", damage, self.current_health)
+
+    def on_battle_damage_sequence(self, event: Event) -> None:
+        """Handle several hits taken in one battle, published as one event."""
+        damage = sum(event.data.get("damages", ()))
+        self._apply_damage(damage)
+        self._debug("Player took %s damage in sequence. Current health: %s", damage, self.current_health)
+
+    def on_player_healed(self, event: PlayerHealedEvent) -> None:
         """Handle healing event."""
-        healing = event.data.get("healing", 0)
+        healing = event.healing
         self.healing_received += healing
         self.current_health = min(self.max_health, self.current_health + healing)
-        logger.debug(f"Player healed {healing}. Current health: {self.current_health}")
+        self._debug("Player healed %s. Current health: %s", healing, self.current_health)
 
     def on_player_fainted(self, event: Event) -> None:
         """Handle faint/knockout event."""
         self.knockouts += 1
         self.current_health = 0
-        logger.info(f"Player fainted! Total knockouts: {self.knockouts}")
+        self._info("Player fainted! Total knockouts: %d", self.knockouts)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Return health statistics."""
@@ -201,11 +233,12 @@ class HealthMonitor:
         }
 
 
-class InteractionTracker:
+class InteractionTracker(LogMethodsMixin):
     """Tracks player interactions with NPCs and objects."""
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.npc_interactions = 0
         self.items_collected = 0
         self.doors_opened = 0
@@ -221,13 +254,13 @@ class InteractionTracker:
     def on_npc_interaction(self, event: Event) -> None:
         """Handle NPC interaction event."""
         self.npc_interactions += 1
-        logger.debug(f"NPC interaction #{self.npc_interactions}")
+        self._debug("NPC interaction #%d", self.npc_interactions)
 
     def on_item_collected(self, event: Event) -> None:
         """Handle item collection event."""
         self.items_collected += 1
         item_name = event.data.get("item", "unknown")
-        logger.debug(f"Item collected: {item_name}")
+        self._debug("Item collected: %s", item_name)
 
     def on_door_opened(self, event: Event) -> None:
         """Handle door opening event."""
@@ -247,11 +280,12 @@ class InteractionTracker:
         }
 
 
-class ReportGenerator:
+class ReportGenerator(LogMethodsMixin):
     """Generates comprehensive reports from all event processors."""
 
     def __init__(self, event_bus: EventBus, processors: Dict[str, Any]):
         self.event_bus = event_bus
+        self.reconfigure_logging()
         self.processors = processors
         self.reports_generated = 0
 
@@ -268,16 +302,16 @@ class ReportGenerator:
 
     def on_game_ended(self, event: Event) -> None:
         """Automatically generate report when game ends."""
-        logger.info("\n" + "="*60)
-        logger.info("GAME ENDED - Generating Final Report")
-        logger.info("="*60)
+        self._info("\n" + "="*60)
+        self._info("GAME ENDED - Generating Final Report")
+        self._info("="*60)
         report = self.generate_report()
         self.print_report(report)
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive statistics report."""
         report = {
-            "generated_at": datetime.now(),
+            "generated_at": _now(),
             "statistics": {}
         }
 
@@ -288,25 +322,30 @@ class ReportGenerator:
         return report
 
     def print_report(self, report: Dict[str, Any]) -> None:
-        """Print formatted report to console."""
-        print("\n" + "="*60)
-        print(f"GAMEPLAY STATISTICS REPORT")
-        print(f"Generated at: {report['generated_at'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*60)
+        """Print formatted report to console in a single write."""
+        lines = [
+            "\n" + "="*60,
+            "GAMEPLAY STATISTICS REPORT",
+            f"Generated at: {report['generated_at'].strftime('%Y-%m-%d %H:%M:%S')}",
+            "="*60
+        ]
+        append = lines.append
 
         for processor_name, stats in report["statistics"].items():
-            print(f"\n[{processor_name.upper()}]")
+            append(f"\n[{processor_name.upper()}]")
             for key, value in stats.items():
                 if isinstance(value, float):
-                    print(f"  {key}: {value:.2f}")
+                    append(f"  {key}: {value:.2f}")
                 elif isinstance(value, dict):
-                    print(f"  {key}:")
+                    append(f"  {key}:")
                     for sub_key, sub_value in value.items():
-                        print(f"    {sub_key}: {sub_value}")
+                        append(f"    {sub_key}: {sub_value}")
                 else:
-                    print(f"  {key}: {value}")
+                    append(f"  {key}: {value}")
 
-        print("\n" + "="*60 + "\n")
+        append("\n" + "="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def get_statistics(self) -> Dict[str, Any]:
         """Return report generator statistics."""
@@ -4,14 +4,15 @@ Main Application - Event-Driven PyBoy Integration
 Orchestrates the Event Bus, Event Processors, and PyBoy Emulator.
 """
 
+import os
 import sys
 import logging
 from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from src.event_bus import EventBus
 from src.event_processors import (
@@ -35,6 +36,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Frames emulated per main-loop iteration; run() polls for events as tick() does
+FRAMES_PER_LOOP = 60
+
 
 class GameApplication:
     """Main application orchestrating all components."""
@@ -68,6 +72,9 @@ class GameApplication:
         self.report_generator = ReportGenerator(self.event_bus, self.processors)
         self.processors["report_generator"] = self.report_generator
 
+        # All subscriptions are in place: enable direct dispatch
+        self.event_bus.compile_dispatch()
+
         logger.info(f"Initialized {len(self.processors)} event processors")
 
         # Initialize PyBoy Wrapper
@@ -93,7 +100,7 @@ class GameApplication:
             # Main game loop
             running = True
             while running:
-                running = self.pyboy_wrapper.tick()
+                running = self.pyboy_wrapper.run(FRAMES_PER_LOOP)
 
         except KeyboardInterrupt:
             logger.info("\n\nKeyboard interrupt received. Stopping game...")
@@ -3,21 +3,58 @@ PyBoy Wrapper - Integrates PyBoy emulator with the Event Bus.
 Monitors game state and publishes events for processors to consume.
 """
 
+import os
 import sys
-from pathlib import Path
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from pyboy import PyBoy
-from src.event_bus import EventBus
-from typing import Optional, Dict, Any
+from src.event_bus import (
+    Event,
+    EventBus,
+    PlayerDamagedEvent,
+    PlayerHealedEvent,
+    PlayerMovedEvent
+)
+from collections import deque
+from concurrent.futures import Future
+from functools import partial
+from typing import Optional, Dict, Any, Callable, Union
+import io
 import logging
+import queue
+import struct
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Example memory addresses for Pokémon Red/Blue; these would need to be
+# adjusted for specific games. All of them fall in one range, fetched
+# with a single slice per poll.
+_BATTLE_TYPE_ADDR = 0xD057   # Battle type indicator (0 = no battle)
+_HP_HIGH_ADDR = 0xD16C       # Current HP of first Pokémon in party
+_HP_LOW_ADDR = 0xD16D
+_MAP_ID_ADDR = 0xD35E
+_Y_POS_ADDR = 0xD361
+_X_POS_ADDR = 0xD362
+
+_STATE_START = _BATTLE_TYPE_ADDR
+_STATE_END = _X_POS_ADDR + 1
+
+# Whole state range decoded in one C-level call: battle type, big-endian HP,
+# map id, y, x (x directly follows y); unused bytes are skipped as padding
+_STATE_FMT = struct.Struct(">B{}xH{}xB{}xBB".format(
+    _HP_HIGH_ADDR - _BATTLE_TYPE_ADDR - 1,
+    _MAP_ID_ADDR - _HP_LOW_ADDR - 1,
+    _Y_POS_ADDR - _MAP_ID_ADDR - 1
+))
+assert _STATE_FMT.size == _STATE_END - _STATE_START
+
+_STATE_IO_BUFFER = 1 << 20
+
 
 class PyBoyEventWrapper:
     """
@@ -25,7 +62,17 @@ class PyBoyEventWrapper:
     Detects game state changes and emits appropriate events.
     """
 
-    def __init__(self, event_bus: EventBus, rom_path: str, window_type: str = "SDL2"):
+    _VALID_BUTTONS = frozenset(("up", "down", "left", "right", "a", "b", "start", "select"))
+
+    # Direction by (sign(dx), sign(dy)); horizontal movement wins on diagonals
+    _DIR_TABLE = {
+        (1, -1): "right", (1, 0): "right", (1, 1): "right",
+        (-1, -1): "left", (-1, 0): "left", (-1, 1): "left",
+        (0, 1): "down", (0, -1): "up", (0, 0): "unknown"
+    }
+
+    def __init__(self, event_bus: EventBus, rom_path: str, window_type: str = "SDL2",
+                 async_dispatch: bool = False):
         """
         Initialize PyBoy wrapper.
 
@@ -33,21 +80,63 @@ class PyBoyEventWrapper:
             event_bus: The event bus to publish events to
             rom_path: Path to the Game Boy ROM file
             window_type: PyBoy window type (SDL2, headless, etc.)
+            async_dispatch: Queue gameplay events and publish them from a
+                            dispatcher thread instead of inside tick()
         """
         self.event_bus = event_bus
         self.rom_path = rom_path
         self.pyboy: Optional[PyBoy] = None
+        self._mem = None
+        self._last_state_fields = None  # Decoded state fields from the previous poll
+        self._send_input = None
         self.window_type = window_type
 
         # Game state tracking
-        self.previous_position = None
-        self.previous_health = None
+        # -1 means "not read yet"; real values are never negative
+        self.previous_position = -1  # Packed (map << 16) | (y << 8) | x
+        self.previous_health = -1
         self.in_battle = False
         self.step_count = 0
         self.frame_count = 0
 
         # Configuration
         self.frames_per_step_check = 60  # Check for steps every ~1 second at 60 FPS
+        self.max_frames_per_check = 120  # Polling back-off cap on idle screens
+        self.poll_warmup = 3             # Polls at the base interval before backing off
+        self.max_backoff_polls = 4       # Backed-off polls in a row before a base-interval poll
+
+        # Adaptive polling: the interval doubles while the game state stays
+        # unchanged and snaps back to frames_per_step_check on any change.
+        # A change (e.g. a battle start) that happens while backed off is
+        # seen up to max_frames_per_check frames late (2 s at 60 FPS);
+        # after max_backoff_polls backed-off polls in a row the interval
+        # restarts from the base, so idle periods never stay at the cap.
+        self._poll_interval = self.frames_per_step_check
+        self._next_poll_frame = self.frames_per_step_check
+        self._polls = 0
+        self._backoff_streak = 0
+
+        # Background mode: a worker thread owns self.pyboy and runs commands
+        # queued by other threads between frames
+        self._cmd_q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._cmd_lock = threading.Lock()
+        self._run_thread: Optional[threading.Thread] = None
+        self._stop_requested = False
+        self._shutdown_pending = False
+
+        # Last screen image, reused until the next frame
+        self._screen_cache = None
+        self._screen_cache_frame = -1
+
+        # Async dispatch: gameplay events go into a bounded ring (oldest
+        # dropped on overflow) drained by a dispatcher thread
+        self.async_dispatch = async_dispatch
+        self._ev_ring: deque = deque(maxlen=4096)
+        self.dropped_events = 0  # Events lost to ring overflow
+        self._ev_ready = threading.Event()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_stop = False
+        self._bind_emitters()
 
         logger.info(f"PyBoyEventWrapper initialized with ROM: {rom_path}")
 
@@ -58,14 +147,194 @@ class PyBoyEventWrapper:
                 self.rom_path,
                 window_type=self.window_type
             )
+            self._mem = self.pyboy.memory
+            self._send_input = self.pyboy.send_input
             logger.info("PyBoy emulator started successfully")
             self.event_bus.publish("game_started", {"rom": self.rom_path})
+            if self.async_dispatch:
+                self._start_dispatcher()
         except Exception as e:
             logger.error(f"Failed to start PyBoy: {e}")
             raise
 
+    def start_background(self) -> None:
+        """
+        Start the PyBoy emulator on a dedicated thread.
+
+        The thread ticks the emulator until stop() is called or the emulator
+        exits and owns self.pyboy meanwhile: press_button, get_screen_image,
+        save_state and load_state called from other threads are queued and
+        run on the emulator thread between frames, while tick, run and
+        tick_n raise RuntimeError off that thread.
+        """
+        self.start()
+        self._stop_requested = False
+        self._shutdown_pending = False
+        self._run_thread = threading.Thread(
+            target=self._run_loop, name="pyboy-emulator", daemon=True
+        )
+        self._run_thread.start()
+
+    def is_running(self) -> bool:
+        """Return True while the background emulator thread is alive."""
+        thread = self._run_thread
+        return thread is not None and thread.is_alive()
+
+    def _run_loop(self) -> None:
+        """Emulator thread body: drain queued commands, then tick."""
+        try:
+            while not self._stop_requested:
+                self._drain_commands()
+                if not self.tick():
+                    break
+        finally:
+            with self._cmd_lock:
+                self._run_thread = None
+                self._drain_commands()
+            if self._shutdown_pending:
+                self._shutdown()
+
+    def _drain_commands(self) -> None:
+        """Run every command queued for the emulator thread."""
+        get = self._cmd_q.get_nowait
+        while True:
+            try:
+                fn, args, future = get()
+            except queue.Empty:
+                return
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if future is None:
+                    logger.error(f"Error in queued emulator command: {e}")
+                else:
+                    future.set_exception(e)
+            else:
+                if future is not None:
+                    future.set_result(result)
+
+    def _check_owner(self) -> None:
+        """Refuse to drive the emulator from outside its background thread."""
+        thread = self._run_thread
+        if thread is not None and thread is not threading.current_thread():
+            raise RuntimeError("Emulator is running on a background thread; use stop() first")
+
+    def _on_emulator_thread(self, fn: Callable, *args, wait: bool = True) -> Any:
+        """
+        Run fn on the emulator thread if one is active, otherwise inline.
+
+        Args:
+            fn: Callable touching self.pyboy
+            args: Positional arguments for fn
+            wait: Block until fn ran and return its result
+
+        Returns:
+            fn's result, or None when not waiting on a queued command
+        """
+        with self._cmd_lock:
+            thread = self._run_thread
+            queued = thread is not None and thread is not threading.current_thread()
+            if queued:
+                future = Future() if wait else None
+                self._cmd_q.put((fn, args, future))
+
+        if not queued:
+            return fn(*args)
+        return future.result() if wait else None
+
+    def _start_dispatcher(self) -> None:
+        """Start the thread publishing queued gameplay events."""
+        self._dispatch_stop = False
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop, name="pyboy-dispatch", daemon=True
+        )
+        self._dispatch_thread.start()
+        self._bind_emitters()
+
+    def _stop_dispatcher(self) -> None:
+        """Publish whatever is still queued, then stop the dispatcher."""
+        thread = self._dispatch_thread
+        if thread is None:
+            return
+        self._dispatch_stop = True
+        if thread is threading.current_thread():
+            # Called by a subscriber on the dispatcher thread: flush the
+            # rest of the ring here, in order; the loop then exits
+            ring = self._ev_ring
+            while ring:
+                topic, payload = ring.popleft()
+                self.event_bus.publish(topic, payload)
+        else:
+            self._ev_ready.set()
+            thread.join()
+        self._dispatch_thread = None
+        self._bind_emitters()
+
+    def _dispatch_loop(self) -> None:
+        """Dispatcher thread body: publish queued events in order."""
+        ring = self._ev_ring
+        ready = self._ev_ready
+        publish = self.event_bus.publish
+        while True:
+            ready.wait()
+            ready.clear()
+            while ring:
+                topic, payload = ring.popleft()
+                publish(topic, payload)
+            if self._dispatch_stop:
+                return
+
+    def _enqueue(self, topic: Union[str, Event], payload: Dict[str, Any] = None) -> None:
+        """Queue a gameplay event (topic and payload, or an Event) for the dispatcher."""
+        ring = self._ev_ring
+        if len(ring) == ring.maxlen:
+            # The oldest event is about to be dropped; a lost battle_started
+            # or battle_ended leaves battle statistics inconsistent
+            self.dropped_events += 1
+            if self.dropped_events % 1000 == 1:
+                logger.warning("Event queue full (%d events): dropped %d event(s) so far",
+                               ring.maxlen, self.dropped_events)
+        ring.append((topic, payload))
+        self._ev_ready.set()
+
+    def _bind_emitters(self) -> None:
+        """
+        Pre-bind one publisher per gameplay topic.
+
+        Each emitter is either EventBus.publish or _enqueue, depending on
+        whether the dispatcher thread runs. Dict topics get the topic already
+        applied; movement and health emitters take a ready-made typed event,
+        so no payload dict is built for them.
+        """
+        emit = self.event_bus.publish if self._dispatch_thread is None else self._enqueue
+        self._emit_moved = emit
+        self._emit_battle_started = partial(emit, "battle_started")
+        self._emit_battle_ended = partial(emit, "battle_ended")
+        self._emit_damaged = emit
+        self._emit_fainted = partial(emit, "player_fainted")
+        self._emit_healed = emit
+
     def stop(self) -> None:
         """Stop the PyBoy emulator."""
+        thread = self._run_thread
+        if thread is not None:
+            self._stop_requested = True
+            if thread is threading.current_thread():
+                # Called by a subscriber on the emulator thread: _run_loop
+                # finishes the shutdown once the current frame returns
+                self._shutdown_pending = True
+                return
+            thread.join()
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        """Flush queued events, publish game_ended and stop PyBoy."""
+        self._shutdown_pending = False
+        self._stop_dispatcher()
+        if self.dropped_events:
+            logger.warning("%d gameplay event(s) were dropped by the full event queue",
+                           self.dropped_events)
+
         if self.pyboy:
             self.event_bus.publish("game_ended", {
                 "total_frames": self.frame_count,
@@ -81,120 +350,191 @@ class PyBoyEventWrapper:
         Returns:
             True if emulator is still running, False otherwise
         """
-        if not self.pyboy:
+        pyboy = self.pyboy
+        if not pyboy:
             return False
+        if self._run_thread is not None:
+            self._check_owner()
 
         try:
             # Tick the emulator for one frame
-            self.pyboy.tick()
+            pyboy.tick()
             self.frame_count += 1
 
             # Check game state periodically to detect events
-            if self.frame_count % self.frames_per_step_check == 0:
-                self._check_for_events()
+            if self.frame_count >= self._next_poll_frame:
+                self._schedule_next_poll(self._check_for_events())
 
-            return not self.pyboy.stopped
+            return not pyboy.stopped
         except Exception as e:
             logger.error(f"Error during emulation tick: {e}")
             return False
 
-    def _check_for_events(self) -> None:
-        """Check game state and publish appropriate events."""
+    def run(self, n_frames: int) -> bool:
+        """
+        Process several frames of emulation, emitting events as in tick().
+
+        Hot attribute lookups are bound to locals once for the whole batch.
+
+        Args:
+            n_frames: Number of frames to emulate
+
+        Returns:
+            True if emulator is still running, False otherwise
+        """
+        self._check_owner()
+        pyboy = self.pyboy
+        if not pyboy:
+            return False
+
+        tick = pyboy.tick
+        check = self._check_for_events
+        schedule = self._schedule_next_poll
+        fc = self.frame_count
         try:
-            # Get current game state from memory
-            # Note: Memory addresses are game-specific (these are examples for Pokémon)
-            current_position = self._get_player_position()
-            current_health = self._get_player_health()
-            in_battle = self._is_in_battle()
+            for _ in range(n_frames):
+                # Tick the emulator for one frame
+                tick()
+                fc += 1
+
+                # Check game state periodically to detect events
+                if fc >= self._next_poll_frame:
+                    self.frame_count = fc
+                    schedule(check())
+
+                if pyboy.stopped:
+                    return False
+            return True
+        except Exception as e:
+            logger.error(f"Error during emulation tick: {e}")
+            return False
+        finally:
+            self.frame_count = fc
+
+    def tick_n(self, n: int) -> bool:
+        """
+        Advance n frames in one PyBoy call and check for events once at the end.
+
+        Intended for frame-skipping loops (e.g. RL agents) that only observe
+        the game every n frames; intermediate frames are not polled.
+
+        Args:
+            n: Number of frames to emulate
+
+        Returns:
+            True if emulator is still running, False otherwise
+        """
+        self._check_owner()
+        pyboy = self.pyboy
+        if not pyboy:
+            return False
+
+        try:
+            pyboy.tick(n)
+            self.frame_count += n
+            self._schedule_next_poll(self._check_for_events())
+            return not pyboy.stopped
+        except Exception as e:
+            logger.error(f"Error during emulation tick: {e}")
+            return False
+
+    def _schedule_next_poll(self, changed: bool) -> None:
+        """Back off polling while the game state is stable, reset on change."""
+        self._polls += 1
+        if (changed or self._polls <= self.poll_warmup
+                or self._backoff_streak >= self.max_backoff_polls):
+            self._poll_interval = self.frames_per_step_check
+            self._backoff_streak = 0
+        else:
+            self._poll_interval = min(self._poll_interval * 2, self.max_frames_per_check)
+            self._backoff_streak += 1
+        self._next_poll_frame = self.frame_count + self._poll_interval
+
+    def _check_for_events(self) -> bool:
+        """
+        Check game state and publish appropriate events.
+
+        Returns:
+            True if the game state changed since the previous check
+        """
+        changed = False
+        try:
+            state = self._read_state()
+            if state is None:
+                # Menus, text boxes, cutscenes: nothing to decode or publish
+                return False
+            current_position, current_health, in_battle = state
 
             # Detect movement/steps
-            if current_position != self.previous_position and current_position is not None:
+            if current_position != self.previous_position:
                 self._handle_movement(current_position)
                 self.previous_position = current_position
+                changed = True
 
             # Detect battle start/end
-            if in_battle and not self.in_battle:
-                self._handle_battle_start()
-            elif not in_battle and self.in_battle:
-                self._handle_battle_end()
+            if in_battle != self.in_battle:
+                if in_battle:
+                    self._handle_battle_start()
+                else:
+                    self._handle_battle_end()
+                changed = True
 
             self.in_battle = in_battle
 
             # Detect health changes
-            if current_health != self.previous_health and current_health is not None:
+            if current_health != self.previous_health:
                 self._handle_health_change(current_health)
                 self.previous_health = current_health
+                changed = True
 
         except Exception as e:
-            logger.debug(f"Error checking game events: {e}")
+            logger.debug("Error checking game events: %s", e)
+            changed = True
 
-    def _get_player_position(self) -> Optional[tuple]:
-        """
-        Get current player position from game memory.
-        Memory addresses are game-specific.
+        return changed
+
+    def _read_state(self) -> Optional[tuple]:
         """
-        try:
-            # Example memory addresses for Pokémon Red/Blue
-            # These would need to be adjusted for specific games
-            x_pos = self.pyboy.get_memory_value(0xD362)
-            y_pos = self.pyboy.get_memory_value(0xD361)
-            map_id = self.pyboy.get_memory_value(0xD35E)
-            return (x_pos, y_pos, map_id)
-        except:
-            return None
+        Read player position, health and battle flag in one bulk memory read.
+        Memory addresses are game-specific (these are examples for Pokémon).
 
-    def _get_player_health(self) -> Optional[int]:
-        """Get current player health from game memory."""
-        try:
-            # Example memory address for Pokémon Red/Blue
-            # Current HP of first Pokémon in party
-            hp_high = self.pyboy.get_memory_value(0xD16C)
-            hp_low = self.pyboy.get_memory_value(0xD16D)
-            return (hp_high << 8) | hp_low
-        except:
+        Returns:
+            (position, health, in_battle), with position packed as
+            ``(map_id << 16) | (y << 8) | x`` so positions compare as one int;
+            None if those fields are unchanged since the last poll (unrelated
+            bytes inside the read range are ignored)
+        """
+        fields = _STATE_FMT.unpack(bytes(self._mem[_STATE_START:_STATE_END]))
+        if fields == self._last_state_fields:
             return None
-
-    def _is_in_battle(self) -> bool:
-        """Check if currently in a battle."""
-        try:
-            # Example memory address for Pokémon Red/Blue
-            # Battle type indicator (0 = no battle)
-            battle_type = self.pyboy.get_memory_value(0xD057)
-            return battle_type != 0
-        except:
-            return False
-
-    def _handle_movement(self, new_position: tuple) -> None:
-        """Handle player movement event."""
-        if self.previous_position is None:
+        self._last_state_fields = fields
+        battle_type, health, map_id, y_pos, x_pos = fields
+        position = (map_id << 16) | (y_pos << 8) | x_pos
+        return position, health, battle_type != 0
+
+    def _handle_movement(self, new_position: int) -> None:
+        """Handle player movement event (positions are packed ints)."""
+        old = self.previous_position
+        if old < 0:
             return
 
-        old_x, old_y, old_map = self.previous_position
-        new_x, new_y, new_map = new_position
-
         # Determine direction if on same map
-        if old_map == new_map:
-            direction = "unknown"
-            if new_x > old_x:
-                direction = "right"
-            elif new_x < old_x:
-                direction = "left"
-            elif new_y > old_y:
-                direction = "down"
-            elif new_y < old_y:
-                direction = "up"
+        if (old >> 16) == (new_position >> 16):
+            old_x, old_y = old & 0xFF, (old >> 8) & 0xFF
+            new_x, new_y = new_position & 0xFF, (new_position >> 8) & 0xFF
+            dx = (new_x > old_x) - (new_x < old_x)
+            dy = (new_y > old_y) - (new_y < old_y)
+            direction = PyBoyEventWrapper._DIR_TABLE[(dx, dy)]
 
             self.step_count += 1
-            self.event_bus.publish("player_moved", {
-                "direction": direction,
-                "position": new_position,
-                "step_number": self.step_count
-            })
+            self._emit_moved(PlayerMovedEvent(
+                direction, (new_x, new_y, new_position >> 16), self.step_count
+            ))
 
     def _handle_battle_start(self) -> None:
         """Handle battle start event."""
         logger.info("Battle started!")
-        self.event_bus.publish("battle_started", {
+        self._emit_battle_started({
             "frame": self.frame_count
         })
 
@@ -203,37 +543,33 @@ class PyBoyEventWrapper:
         logger.info("Battle ended!")
         # Try to determine battle result
         result = "unknown"  # Would need game-specific logic
-        self.event_bus.publish("battle_ended", {
+        self._emit_battle_ended({
             "frame": self.frame_count,
             "result": result
         })
 
     def _handle_health_change(self, new_health: int) -> None:
         """Handle health change event."""
-        if self.previous_health is None:
+        if self.previous_health < 0:
             return
 
         health_delta = new_health - self.previous_health
 
         if health_delta < 0:
             # Player took damage
-            self.event_bus.publish("player_damaged", {
-                "damage": abs(health_delta),
-                "current_health": new_health,
-                "previous_health": self.previous_health
-            })
+            self._emit_damaged(PlayerDamagedEvent(
+                -health_delta, new_health, self.previous_health
+            ))
 
             if new_health == 0:
-                self.event_bus.publish("player_fainted", {
+                self._emit_fainted({
                     "frame": self.frame_count
                 })
         elif health_delta > 0:
             # Player healed
-            self.event_bus.publish("player_healed", {
-                "healing": health_delta,
-                "current_health": new_health,
-                "previous_health": self.previous_health
-            })
+            self._emit_healed(PlayerHealedEvent(
+                health_delta, new_health, self.previous_health
+            ))
 
     def press_button(self, button: str) -> None:
         """
@@ -244,38 +580,50 @@ class PyBoyEventWrapper:
         """
         if not self.pyboy:
             return
+        self._on_emulator_thread(self._press_button, button, wait=False)
 
-        button_map = {
-            "up": "up",
-            "down": "down",
-            "left": "left",
-            "right": "right",
-            "a": "a",
-            "b": "b",
-            "start": "start",
-            "select": "select"
-        }
-
-        if button.lower() in button_map:
-            self.pyboy.send_input(button_map[button.lower()])
-            logger.debug(f"Button pressed: {button}")
+    def _press_button(self, button: str) -> None:
+        """Send a button press to the emulator (emulator thread only)."""
+        name = button.lower()
+        if name in PyBoyEventWrapper._VALID_BUTTONS:
+            self._send_input(name)
+            logger.debug("Button pressed: %s", button)
 
     def get_screen_image(self):
-        """Get current screen image."""
-        if self.pyboy:
-            return self.pyboy.screen_image()
-        return None
+        """Get current screen image, captured at most once per frame."""
+        if not self.pyboy:
+            return None
+        return self._on_emulator_thread(self._get_screen_image)
+
+    def _get_screen_image(self):
+        """Return the cached screen image for this frame (emulator thread only)."""
+        if self._screen_cache_frame != self.frame_count:
+            self._screen_cache = self.pyboy.screen_image()
+            self._screen_cache_frame = self.frame_count
+        return self._screen_cache
 
     def save_state(self, filename: str) -> None:
         """Save emulator state to file."""
         if self.pyboy:
-            with open(filename, "wb") as f:
-                self.pyboy.save_state(f)
+            self._on_emulator_thread(self._save_state, filename)
             logger.info(f"State saved to {filename}")
 
     def load_state(self, filename: str) -> None:
         """Load emulator state from file."""
         if self.pyboy:
-            with open(filename, "rb") as f:
-                self.pyboy.load_state(f)
+            self._on_emulator_thread(self._load_state, filename)
             logger.info(f"State loaded from {filename}")
+
+    def _save_state(self, filename: str) -> None:
+        """Write emulator state to file (emulator thread only)."""
+        # State blobs are tens of KB: buffer the whole write
+        with open(filename, "wb", buffering=_STATE_IO_BUFFER) as f:
+            self.pyboy.save_state(f)
+
+    def _load_state(self, filename: str) -> None:
+        """Read emulator state from file (emulator thread only)."""
+        # One bulk read, then let PyBoy parse from memory
+        with open(filename, "rb") as f:
+            state = io.BytesIO(f.read())
+        self.pyboy.load_state(state)
+        self._screen_cache_frame = -1
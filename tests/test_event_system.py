@@ -4,17 +4,26 @@ Test script to validate the Event Bus and Event Processors.
 Simulates game events without requiring a ROM file.
 """
 
+import importlib
+import io
+import os
 import sys
+import tempfile
+import threading
 import time
+import types
 import logging
-from pathlib import Path
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
 
 # Add project root to Python path
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from src.event_bus import EventBus
+from src.event_bus import Event, EventBus, PlayerDamagedEvent, PlayerMovedEvent
 from src.event_processors import (
     BattleCounterProcessor,
     StepCounterProcessor,
@@ -28,16 +37,44 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class VirtualClock:
+    """Deterministic clock: sleep() advances virtual time instantly."""
+
+    def __init__(self):
+        self.t = 0.0
+        self._epoch = datetime.now()
+
+    def sleep(self, seconds: float) -> None:
+        self.t += seconds
+
+    def now(self) -> datetime:
+        return self._epoch + timedelta(seconds=self.t)
+
+    @contextmanager
+    def installed(self):
+        """Route time.sleep and event timestamps through this clock."""
+        with patch("time.sleep", self.sleep), \
+                patch("src.event_bus._now", self.now), \
+                patch("src.event_processors._now", self.now):
+            yield self
+
+
 def simulate_gameplay():
     """Simulate a complete gameplay session with various events."""
+    # Pacing sleeps only space out timestamps, so run them on virtual time
+    with VirtualClock().installed():
+        _simulate_gameplay()
+
 
+def _simulate_gameplay():
     print("="*60)
     print("Testing Event-Driven Architecture")
     print("Simulating gameplay events...")
     print("="*60 + "\n")
 
-    # Initialize Event Bus
+    # Initialize Event Bus (recording history for the final summary)
     event_bus = EventBus()
+    event_bus.enable_history()
 
     # Initialize all event processors
     processors = {
@@ -50,6 +87,7 @@ def simulate_gameplay():
 
     # Initialize Report Generator
     report_generator = ReportGenerator(event_bus, processors)
+    event_bus.compile_dispatch()
 
     print("\n✓ All components initialized\n")
     time.sleep(1)
@@ -201,6 +239,28 @@ def test_event_bus_basic():
     assert len(received_events) == 1, "Should still have 1 event after unsubscribe"
     print("✓ Unsubscribed successfully")
 
+    # Test unsubscribe by handle
+    handle = event_bus.subscribe("test_event", test_callback)
+    event_bus.unsubscribe("test_event", handle)
+    event_bus.publish("test_event", {"data": "test2"})
+    assert len(received_events) == 1, "Should still have 1 event after handle unsubscribe"
+    print("✓ Unsubscribed by handle successfully")
+
+    # Test opt-in history
+    assert event_bus.get_event_history() == [], "History should be off by default"
+    event_bus.enable_history()
+    event_bus.publish("test_event", {"data": "test3"})
+    assert len(event_bus.get_event_history()) == 1, "Should record 1 event"
+    print("✓ Event history recorded when enabled")
+
+    # Test bounded history keeps only the newest events
+    bounded_bus = EventBus(history_limit=3)
+    bounded_bus.enable_history()
+    for i in range(4):
+        bounded_bus.publish("test_event", {"n": i})
+    assert [e.data["n"] for e in bounded_bus.get_event_history()] == [1, 2, 3]
+    print("✓ Event history bounded by history_limit")
+
     # Test multiple subscribers
     callbacks = [lambda e: None for _ in range(3)]
     for cb in callbacks:
@@ -209,9 +269,305 @@ def test_event_bus_basic():
     assert event_bus.get_subscribers_count("multi_test") == 3
     print("✓ Multiple subscribers registered")
 
+    # Test typed events, published directly or built from a dict
+    moves = []
+    event_bus.subscribe("player_moved", moves.append)
+    event_bus.publish(PlayerMovedEvent("up", (1, 1, 1), 1))
+    event_bus.publish("player_moved", {"direction": "left", "position": (0, 1, 1), "step_number": 2})
+    assert [e.direction for e in moves] == ["up", "left"]
+    assert moves[0].data["step_number"] == 1
+    print("✓ Typed events expose payload fields as attributes")
+
+    # Test plain Events for typed event types are converted too
+    damages = []
+    event_bus.subscribe("player_damaged", damages.append)
+    plain = Event("player_damaged", {"damage": 5})
+    event_bus.publish(plain)
+    assert isinstance(damages[0], PlayerDamagedEvent) and damages[0].damage == 5
+    assert damages[0].timestamp == plain.timestamp
+    print("✓ Plain Events for typed event types are converted")
+
+    # Test direct dispatch stays in sync with subscriptions
+    event_bus.compile_dispatch()
+    direct_events = []
+    event_bus.subscribe("direct_test", direct_events.append)
+    event_bus.publish("direct_test", {})
+    event_bus.subscribe("direct_test", direct_events.append)
+    event_bus.publish("direct_test", {})
+    assert len(direct_events) == 3, "Should dispatch to 1 then 2 subscribers"
+    print("✓ Direct dispatch follows subscription changes")
+
+    # Test processors re-bind their log methods after a level change
+    processor_logger = logging.getLogger("src.event_processors")
+    monitor = HealthMonitor(event_bus)
+    previous_level = processor_logger.level
+    processor_logger.setLevel(logging.DEBUG)
+    try:
+        monitor.reconfigure_logging()
+        assert monitor._debug == processor_logger.debug, "DEBUG should be re-bound"
+    finally:
+        processor_logger.setLevel(previous_level)
+        monitor.reconfigure_logging()
+    print("✓ Processors re-bind log methods on reconfigure")
+
     print("\n✓ All Event Bus tests passed!\n")
 
 
+def test_health_monitor_damage_sequence():
+    """Test battle_damage_sequence matching the equivalent player_damaged events."""
+    sequence_bus, single_bus = EventBus(), EventBus()
+    sequence_monitor = HealthMonitor(sequence_bus)
+    single_monitor = HealthMonitor(single_bus)
+
+    sequence_bus.publish("battle_damage_sequence", {"damages": [10, 20]})
+    for damage in (10, 20):
+        single_bus.publish("player_damaged", {"damage": damage})
+
+    assert sequence_monitor.get_statistics() == single_monitor.get_statistics()
+    assert sequence_monitor.damage_taken == 30 and sequence_monitor.current_health == 70
+    print("✓ battle_damage_sequence totals match separate player_damaged events")
+
+
+class FakePyBoy:
+    """Minimal PyBoy stand-in: flat bytearray memory, recorded inputs."""
+
+    def __init__(self, rom_path, window_type=None):
+        self.memory = bytearray(0x10000)
+        self.stopped = False
+        self.frames = 0
+        self.inputs = []
+        self.send_input = self.inputs.append
+
+    def tick(self, count=1):
+        self.frames += count
+        return True
+
+    def screen_image(self):
+        return ("screen", self.frames)
+
+    def save_state(self, f):
+        f.write(b"state")
+
+    def load_state(self, f):
+        self.loaded_from = f
+        self.loaded = f.read()
+
+    def stop(self):
+        self.stopped = True
+
+
+_wrapper_module = None
+
+
+def _load_wrapper_module():
+    """Import src.pyboy_wrapper against FakePyBoy instead of the real emulator."""
+    global _wrapper_module
+    if _wrapper_module is None:
+        stub = types.ModuleType("pyboy")
+        stub.PyBoy = FakePyBoy
+        with patch.dict(sys.modules, {"pyboy": stub}):
+            sys.modules.pop("src.pyboy_wrapper", None)
+            _wrapper_module = importlib.import_module("src.pyboy_wrapper")
+    return _wrapper_module
+
+
+def _set_position(mem, wrapper_module, map_id, y, x):
+    mem[wrapper_module._MAP_ID_ADDR] = map_id
+    mem[wrapper_module._Y_POS_ADDR] = y
+    mem[wrapper_module._X_POS_ADDR] = x
+
+
+def test_wrapper_state_decoding():
+    """Test memory decoding, movement directions and damage events."""
+    wm = _load_wrapper_module()
+    event_bus = EventBus()
+    received = []
+    for topic in ("player_moved", "player_damaged"):
+        event_bus.subscribe(topic, received.append)
+    wrapper = wm.PyBoyEventWrapper(event_bus, "test.gb", window_type="null")
+    wrapper.start()
+    mem = wrapper.pyboy.memory
+    _set_position(mem, wm, 1, 5, 5)
+    mem[wm._HP_HIGH_ADDR], mem[wm._HP_LOW_ADDR] = 0x01, 0x2C
+    assert wrapper._read_state() == ((1 << 16) | (5 << 8) | 5, 300, False)
+    mem[wm._HP_LOW_ADDR + 1] = 0xFF
+    assert wrapper._read_state() is None, "Unrelated bytes should not count as a change"
+    print("✓ State decoded into packed position, health and battle flag")
+
+    wrapper._last_state_fields = None
+    wrapper._check_for_events()
+    assert received == [], "First poll only records the initial state"
+    for y, x in ((5, 6), (4, 6), (4, 5), (5, 5)):
+        _set_position(mem, wm, 1, y, x)
+        wrapper._check_for_events()
+    mem[wm._HP_LOW_ADDR] = 0x22
+    wrapper._check_for_events()
+    assert [e.direction for e in received[:4]] == ["right", "up", "left", "down"]
+    assert received[0].position == (6, 5, 1) and received[3].step_number == 4
+    assert received[4].damage == 10 and received[4].current_health == 290
+    print("✓ Movement directions and damage decoded from memory")
+
+
+def test_wrapper_poll_backoff():
+    """Test the poll interval doubling on a stable state, then resetting."""
+    wm = _load_wrapper_module()
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start()
+    intervals = []
+    for _ in range(8):
+        wrapper.run(wrapper._next_poll_frame - wrapper.frame_count)
+        intervals.append(wrapper._poll_interval)
+    assert intervals == [60, 60, 60, 120, 120, 120, 120, 60], intervals
+    wrapper.run(wrapper._next_poll_frame - wrapper.frame_count)
+    assert wrapper._poll_interval == 120
+    wrapper.pyboy.memory[wm._X_POS_ADDR] = 1
+    wrapper.run(wrapper._next_poll_frame - wrapper.frame_count)
+    assert wrapper._poll_interval == 60, "A state change should reset the interval"
+    print("✓ Poll interval backs off while idle and resets on change")
+
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start()
+    for _ in range(wrapper.frames_per_step_check):
+        assert wrapper.tick()
+    assert wrapper._polls == 1 and wrapper.frame_count == wrapper.frames_per_step_check
+    print("✓ tick() polls on the same schedule as run()")
+
+
+def test_wrapper_tick_n():
+    """Test tick_n advancing n frames with a single poll at the end."""
+    wm = _load_wrapper_module()
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start()
+    checks = []
+    check_for_events = wrapper._check_for_events
+    wrapper._check_for_events = lambda: checks.append(wrapper.frame_count) or check_for_events()
+    assert wrapper.tick_n(200)
+    assert wrapper.frame_count == 200 and wrapper.pyboy.frames == 200
+    assert checks == [200], "tick_n should poll exactly once, after the last frame"
+    assert wrapper._next_poll_frame == 200 + wrapper._poll_interval
+    print("✓ tick_n advances n frames, polls once and reschedules the next poll")
+
+
+def test_wrapper_screen_cache():
+    """Test the screen image being captured at most once per frame."""
+    wm = _load_wrapper_module()
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start()
+    first = wrapper.get_screen_image()
+    assert wrapper.get_screen_image() is first, "Same frame should reuse the image"
+    wrapper.tick()
+    assert wrapper.get_screen_image() is not first, "A new frame should capture again"
+    print("✓ Screen image cached within a frame and refreshed on the next")
+
+
+def test_wrapper_load_state():
+    """Test load_state reading the file in one go and dropping the screen cache."""
+    wm = _load_wrapper_module()
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start()
+    wrapper.get_screen_image()
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, "test.state")
+        wrapper.save_state(state_path)
+        wrapper.load_state(state_path)
+    assert isinstance(wrapper.pyboy.loaded_from, io.BytesIO)
+    assert wrapper.pyboy.loaded == b"state", "State should round-trip through the file"
+    assert wrapper._screen_cache_frame == -1, "Loading a state should drop the screen cache"
+    print("✓ load_state round-trips through BytesIO and invalidates the screen cache")
+
+
+def test_wrapper_async_dispatch():
+    """Test async dispatch keeps order and flushes before game_ended."""
+    wm = _load_wrapper_module()
+    event_bus = EventBus()
+    delivered = []
+
+    def record(event):
+        delivered.append((event.event_type, threading.current_thread().name))
+
+    event_bus.subscribe("player_moved", record)
+    event_bus.subscribe("game_ended", record)
+    wrapper = wm.PyBoyEventWrapper(event_bus, "test.gb", window_type="null",
+                                   async_dispatch=True)
+    wrapper.start()
+    mem = wrapper.pyboy.memory
+    for x in range(6):
+        _set_position(mem, wm, 1, 1, x)
+        wrapper._check_for_events()
+    wrapper.stop()
+    assert [t for t, _ in delivered] == ["player_moved"] * 5 + ["game_ended"]
+    assert all(name == "pyboy-dispatch" for _, name in delivered[:5])
+    print("✓ Async dispatch delivers in order and flushes before game_ended")
+
+    # A full ring drops the oldest events and counts them
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null",
+                                   async_dispatch=True)
+    wrapper._ev_ring = deque(maxlen=2)
+    for i in range(5):
+        wrapper._enqueue("battle_started", {"frame": i})
+    assert wrapper.dropped_events == 3
+    assert [payload["frame"] for _, payload in wrapper._ev_ring] == [3, 4]
+    print("✓ Overflowing the async queue counts the dropped events")
+
+
+def test_wrapper_background():
+    """Test background mode: queued commands run on the emulator thread."""
+    wm = _load_wrapper_module()
+    wrapper = wm.PyBoyEventWrapper(EventBus(), "test.gb", window_type="null")
+    wrapper.start_background()
+    assert wrapper.is_running()
+    wrapper.press_button("A")
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = os.path.join(tmp, "test.state")
+        wrapper.save_state(state_path)
+        with open(state_path, "rb") as f:
+            assert f.read() == b"state"
+    try:
+        wrapper.tick()
+        assert False, "tick() off the emulator thread should raise"
+    except RuntimeError:
+        pass
+    wrapper.stop()
+    assert not wrapper.is_running() and wrapper.pyboy.stopped
+    assert wrapper.pyboy.inputs == ["a"]
+    print("✓ Background mode runs queued commands, then stops")
+
+    # stop() called by a subscriber on the emulator thread
+    event_bus = EventBus()
+    ended = []
+    event_bus.subscribe("game_ended", ended.append)
+    wrapper = wm.PyBoyEventWrapper(event_bus, "test.gb", window_type="null")
+    event_bus.subscribe("battle_started", lambda e: wrapper.stop())
+    fake = FakePyBoy("test.gb")
+    fake.memory[wm._BATTLE_TYPE_ADDR] = 1  # First poll publishes battle_started
+    with patch.object(wm, "PyBoy", lambda *args, **kwargs: fake):
+        wrapper.start_background()
+        deadline = time.monotonic() + 5
+        while wrapper.is_running() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert not wrapper.is_running(), "Emulator thread should exit after stop()"
+    assert len(ended) == 1 and fake.stopped
+    print("✓ stop() from a subscriber shuts down after the current frame")
+
+
+def run_wrapper_tests():
+    """Run the PyBoyEventWrapper tests against a stubbed emulator."""
+
+    print("\n" + "="*60)
+    print("Testing PyBoy Wrapper")
+    print("="*60 + "\n")
+
+    test_wrapper_state_decoding()
+    test_wrapper_poll_backoff()
+    test_wrapper_tick_n()
+    test_wrapper_screen_cache()
+    test_wrapper_load_state()
+    test_wrapper_async_dispatch()
+    test_wrapper_background()
+
+    print("\n✓ All PyBoy Wrapper tests passed!\n")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("EVENT-DRIVEN PYBOY - SYSTEM TEST")
@@ -219,6 +575,8 @@ if __name__ == "__main__":
 
     # Run basic tests
     test_event_bus_basic()
+    test_health_monitor_damage_sequence()
+    run_wrapper_tests()
 
     # Run full simulation
     simulate_gameplay()